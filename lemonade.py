@@ -110,19 +110,19 @@ https://braintumor.org/
 https://www.cancer.org/
 """
 
-from collections import OrderedDict   # ordered dictionaries
-from os import system, name           # operating system specific
+from bisect import bisect_left        # sorted list searches
+from functools import lru_cache       # function result caches
+from os import environ, name, system  # operating system specific
 from random import randrange, uniform # random numbers
-from types import SimpleNamespace     # namespaces support
 
 import locale # culture specific locale
 import math   # math functions
-import re     # regular expressions
-import time   # time functions
+import sys    # system specific
 
-# Set all of the locale category elements as default
-# ex. print(locale.currency(12345.67, grouping=True))
-locale.setlocale(locale.LC_ALL, '')
+# Define the cached values (set on first use)
+_locale_set = False # locale elements set as default (see _set_locale)
+_currency   = None  # currency format (see _money)
+_ansi       = None  # ANSI escape sequence support (see clear)
 
 # Define the ASCII art (original image by Scott S.)
 # (escapes backslashes and double-quotes)
@@ -149,27 +149,311 @@ ascii = """
 '\"'\"'\"'\"'\"'\"'\"'\"'\"'\"'\"'
 """
 
+# Get the ASCII art information
+# (pads each line to the longest line of the image only once)
+_LINES = ascii.splitlines()[1:] # Skip the initial blank line
+_WIDTH = len(_LINES[-1])        # Longest line of the ASCII image
+_LINES_LJ = [ln.ljust(_WIDTH) for ln in _LINES]
+
+# Define the display frame template
+# (combines the ASCII art with one placeholder per line for the messages)
+_FRAME = "".join(ln.replace("{", "{{").replace("}", "}}") + "  {}\n" \
+                 for ln in _LINES_LJ)
+
+# Define the forecast data
+# (parallel percentage values, UTF8 glyphs and display names, indexed by
+# the forecast number; sunny, partly sunny, cloudy, rainy and stormy)
+_FORECAST_PCT   = (1.00, 0.90, 0.70, 0.40, 0.10)
+_FORECAST_GLYPH = (0x2600, 0x26C5, 0x2601, 0x2602, 0x26C8)
+_FORECAST_NAME  = ("Sunny", "Partly Sunny", "Mostly Cloudy", "Rainy", \
+                   "Stormy")
+
+# Define the range of prices searched for the best price
+# (range uses integers, not currency, so convert to floats only once)
+_PRICES = tuple(i / 100 for i in range(25, 2500, 25))
+
+# Define the characters kept from the entered price
+# (removes currency symbols, spaces, etc.)
+_PRICE_CHARS = frozenset("0123456789.-")
+
+
+class _Inventory:
+    """Inventory data (contains the item levels).
+    """
+    __slots__ = ('cups', 'lemons', 'sugar', 'cash', 'start')
+
+    def __init__(self):
+        self.cups   = 0
+        self.lemons = 0
+        self.sugar  = 0
+        self.cash   = 30.00
+        self.start  = 0.00
+
+
+class _Stock:
+    """Grocery item data (includes a calculated cost per unit).
+    """
+    __slots__ = ('cost', 'count', 'min', 'unit')
+
+    def __init__(self, cost, count, min):
+        self.cost  = cost  # current price
+        self.count = count # servings per box or bag
+        self.min   = min   # minimum price
+        self.unit  = 0.00  # unit price
+
+
+class _Weeks:
+    """Weeks data (measures the session duration).
+    """
+    __slots__ = ('current', 'total', 'sales', 'sold', 'summary_lines')
+
+    def __init__(self):
+        self.current       = 1  # start with the 1st week
+        self.total         = 12 # span the 12 weeks of Summer
+        self.sales         = 99 # 99 maximum sales per week
+        self.sold          = 0  # total sales to date
+        self.summary_lines = [] # formatted rows
+
+
+class _Temperature:
+    """Temperature data (uses Fahrenheit as the percentage values).
+    """
+    __slots__ = ('min', 'max', 'units', 'forecast', 'value')
+
+    def __init__(self, units):
+        self.min      = 69
+        self.max      = 100
+        self.units    = units
+        self.forecast = None
+        self.value    = None
+
+
+class _Score:
+    """Score data (based on actual vs. maximum net sales).
+    """
+    __slots__ = ('value', 'total')
+
+    def __init__(self):
+        self.value = 0.00
+        self.total = 0.00
+
+
+def _set_locale():
+    """Sets all of the locale category elements as default, only once.
+    Deferred until the lemonade stand starts, rather than on import.
+    ex. print(locale.currency(12345.67, grouping=True))
+    """
+    global _locale_set, _currency
+    if (not _locale_set):
+        locale.setlocale(locale.LC_ALL, '')
+        _currency = None # the currency format depends on the locale
+        _money.cache_clear()
+        _locale_set = True
+
+
+def _enable_ansi():
+    """Enables the ANSI escape sequences for the console.
+    Returns True when the console supports the escape sequences; Microsoft
+    Windows 10 and later support them once virtual terminal processing is
+    enabled for the console.
+    """
+    if (not sys.stdout.isatty()) or (environ.get('TERM') == 'dumb'):
+        return False
+    if (name != 'nt'):
+        return True
+    try:
+        import ctypes # foreign functions, only used here
+        kernel32 = ctypes.windll.kernel32
+        handle   = kernel32.GetStdHandle(-11) # STD_OUTPUT_HANDLE
+        mode     = ctypes.c_ulong()
+        if (not kernel32.GetConsoleMode(handle, ctypes.byref(mode))):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
 
 def clear():
     """Clears the screen, works across all platforms.
+    Writes the ANSI escape sequences to clear the screen and scrollback and
+    home the cursor, rather than starting a new process to run the "cls" or
+    "clear" command; falls back to the command when the escape sequences are
+    not supported.
     """
-    if (name == 'nt'):
+    global _ansi
+    if (_ansi is None):
+        _ansi = _enable_ansi()
+    if (_ansi):
+        sys.stdout.write("\x1b[2J\x1b[3J\x1b[H")
+        sys.stdout.flush()
+    elif (name == 'nt'):
         _ = system('cls')   # Microsoft Windows
     else:
         _ = system('clear') # All others
 
 
-def get_sales_amount(potential, unit, price):
-    """Gets the sales amount.
+def _get_currency_format(conv):
+    """Gets the currency format for the locale conventions.
+    Returns a tuple of the number format specification and the positive and
+    negative format strings (which place the currency symbol and sign around
+    the number), or None when the locale cannot be formatted this way.
+    Parameters
+    conv : Locale conventions (as returned by locale.localeconv)
+    """
+    digits   = conv['frac_digits']
+    grouping = conv['mon_grouping']
+    if (digits == locale.CHAR_MAX):
+        return None # the 'C' locale does not support currency
+    if (not grouping) or (grouping[0] == locale.CHAR_MAX):
+        spec = f".{digits}f"  # no grouping
+    elif (grouping in ([3, 0], [3, 3, 0])):
+        spec = f",.{digits}f" # thousands grouping
+    else:
+        return None # uncommon grouping, such as Indian lakhs
+    formats = []
+    for prefix, sign in (("p", conv['positive_sign']), \
+                         ("n", conv['negative_sign'])):
+        # '<' and '>' mark where the sign goes between symbol and number
+        value  = "<{}>"
+        symbol = conv['currency_symbol']
+        space  = " " if conv[prefix + '_sep_by_space'] else ""
+        if (conv[prefix + '_cs_precedes']):
+            value = symbol + space + value
+        else:
+            value = value + space + symbol
+        position = conv[prefix + '_sign_posn']
+        if (position == 0):
+            value = "(" + value + ")"
+        elif (position == 2):
+            value = value + sign
+        elif (position == 3):
+            value = value.replace("<", sign)
+        elif (position == 4):
+            value = value.replace(">", sign)
+        else:
+            value = sign + value
+        formats.append(value.replace("<", "").replace(">", ""))
+    table = str.maketrans({ ",": conv['mon_thousands_sep'], \
+                            ".": conv['mon_decimal_point'] })
+    return (spec, table, formats[0], formats[1])
+
+
+@lru_cache(maxsize=256)
+def _money(value):
+    """Formats a value as currency, including the thousands separators.
+    Same as locale.currency(value, grouping=True), except that the locale
+    conventions are only looked up once and then cached; the formatted
+    values are also cached, as the same amounts are often displayed again.
+    Parameters
+    value : Value to format
+    """
+    global _currency
+    if (_currency is None):
+        _currency = _get_currency_format(locale.localeconv()) or ()
+    if (not _currency):
+        return locale.currency(value, grouping=True)
+    spec, table, positive, negative = _currency
+    number = format(abs(value), spec).translate(table)
+    return (negative if (value < 0) else positive).format(number)
+
+
+def _purchase(stock, level, cash, prompt, units, item, skipped):
+    """Reads the number of boxes or bags of an item to purchase.
+    Returns a tuple of the updated inventory level and cash.
+    Parameters
+    stock   : Grocery item data
+    level   : Current inventory level of the item
+    cash    : Current cash
+    prompt  : Prompt for the number to purchase
+    units   : Name of the purchased units (ex. "box(es) of cups")
+    item    : Name of the item in the inventory (ex. "cup")
+    skipped : Message when nothing is purchased
+    """
+    new = -1
+    while (new < 0):
+        try:
+            new = int(input(prompt) or 0)
+            if (new > 0):
+                cost = new * stock.cost
+                if (cost > cash):
+                    raise Exception("You do not have enough cash.")
+                level += (new * stock.count)
+                cash  -= cost
+                print(f"  Purchased {new} {units} for {_money(cost)}")
+                print(f"  {level} {item} inventory, "
+                      f"{_money(cash)} cash remaining")
+            else:
+                print(f"  {skipped}")
+        except Exception as e:
+            print(f"  {e}")
+            new = -1
+    return (level, cash)
+
+
+def get_sales_demand(potential, unit, price):
+    """Gets the sales demand (before rounding down to whole sales).
     Multiply the potential sales by a ratio of unit cost to actual price; the
     exponent results in the values falling along a curve, rather than along a
     straight line, resulting in more realistic sales values at each price.
+    The price to the power of 1.5 is calculated as the square root of the
+    price times the price, which is faster than a fractional exponent.
+    Parameters
+    potential : Potential sales
+    unit      : Unit cost
+    price     : Actual price
+    """
+    return potential * (unit / (math.sqrt(price) * price))
+
+
+def get_sales_amount(potential, unit, price):
+    """Gets the sales amount.
+    Rounds the sales demand down to the number of whole sales.
     Parameters
     potential : Potential sales
     unit      : Unit cost
     price     : Actual price
     """
-    return math.floor(potential * (unit / (price ** 1.5)))
+    return math.floor(get_sales_demand(potential, unit, price))
+
+
+def get_best_price(potential, unit):
+    """Gets the best price.
+    Search the range of prices to find the highest net profit; returns a
+    tuple of the sales, price, gross profit and net profit at the best price
+    (all zeroes when no price returns a profit).
+    Before rounding down to whole sales, the net profit curve peaks at three
+    times the unit cost and falls away on either side; search outward from
+    the peak and stop once the curve drops below the best net profit found,
+    as no price further out can do any better.
+    Parameters
+    potential : Potential sales
+    unit      : Unit cost
+    """
+    maxsales = 0
+    maxprice = 0.00
+    maxgross = 0.00
+    maxnet   = 0.00
+    peak     = bisect_left(_PRICES, unit * 3)
+    for prices in (_PRICES[peak:], reversed(_PRICES[:peak])):
+        for price in prices:
+            demand = get_sales_demand(potential, unit, price)
+            margin = price - unit
+            if (demand * margin < maxnet):
+                break # the curve only falls from here
+            sales  = math.floor(demand)
+            gross  = sales * price
+            net    = sales * margin
+            if (sales  >  0) and \
+                (sales <= potential) and \
+                (unit  <= price):
+                    if (net > maxnet) or \
+                        (net == maxnet and price < maxprice):
+                            maxsales = sales
+                            maxprice = price
+                            maxgross = gross
+                            maxnet   = net
+    return (maxsales, maxprice, maxgross, maxnet)
 
 
 def start_lemonade(title="Lemonade Stand", celsius=False, \
@@ -181,280 +465,158 @@ def start_lemonade(title="Lemonade Stand", celsius=False, \
     noglyphs : Do not display the weather glyphs (limited UTF8 console support)
     nowait   : Skip the "now serving" wait loop
     """
-    
-    # Get the ASCII art information
-    lines = ascii.splitlines()
-    del lines[0]                       # Delete the initial blank line
-    width = len(lines[len(lines) - 1]) # Longest line of the ASCII image
+
+    # Set the locale (selects the currency units)
+    _set_locale()
 
     # Define the temperature unit symbols
     fahrenheit_unit = "ºF"
     celsius_unit    = "ºC"
 
     # Inventory data (contains the item levels)
-    inventoryd = {
-        'cups'   : 0,
-        'lemons' : 0,
-        'sugar'  : 0,
-        'cash'   : 30.00,
-        'start'  : 0.00
-    }
-    inventory = SimpleNamespace(**inventoryd)
+    inventory = _Inventory()
     inventory.start = inventory.cash
 
     # Cups data (includes a calculated cost per unit)
-    cupsd = {
-        'cost'  : 2.50, # current price
-        'count' : 25,   # servings per box
-        'min'   : 0.99, # minimum price
-        'unit'  : 0.00  # unit price
-    }
-    cups = SimpleNamespace(**cupsd)
+    cups = _Stock(cost=2.50, count=25, min=0.99)
     cups.unit = round(cups.cost / cups.count, 2)
 
     # Lemons data (includes a calculated cost per unit)
-    lemonsd = {
-        'cost'  : 4.00, # current price
-        'count' : 8,    # servings per bag
-        'min'   : 2.00, # minimum price
-        'unit'  : 0.00  # unit price
-    }
-    lemons = SimpleNamespace(**lemonsd)
+    lemons = _Stock(cost=4.00, count=8, min=2.00)
     lemons.unit = round(lemons.cost / lemons.count, 2)
 
     # Sugar data (includes a calculated cost per unit)
-    sugard = {
-        'cost'  : 3.00, # current price
-        'count' : 15,   # servings per bag
-        'min'   : 1.50, # minimum price
-        'unit'  : 0.00  # unit price
-    }
-    sugar = SimpleNamespace(**sugard)
+    sugar = _Stock(cost=3.00, count=15, min=1.50)
     sugar.unit  = round(sugar.cost / sugar.count, 2)
 
     # Weeks data (measures the session duration)
-    weeksd = {
-        'current' : 1,   # start with the 1st week
-        'total'   : 12,  # span the 12 weeks of Summer
-        'sales'   : 99,  # 99 maximum sales per week
-        'summary' : []   # empty array
-    }
-    weeks = SimpleNamespace(**weeksd)
-
-    # Forecast data (includes percentage values, UTF8 glyphs and display names)
-    forecastd = OrderedDict()
-    forecastd['sunny']  = [1.00, 0x2600, "Sunny"]
-    forecastd['partly'] = [0.90, 0x26C5, "Partly Sunny"]
-    forecastd['cloudy'] = [0.70, 0x2601, "Mostly Cloudy"]
-    forecastd['rainy']  = [0.40, 0x2602, "Rainy"]
-    forecastd['stormy'] = [0.10, 0x26C8, "Stormy"]
+    weeks = _Weeks()
+    pad_week = len(str(weeks.total)) # widest week number in the summary
+    pad_sale = len(str(weeks.sales)) # widest sales amount in the summary
 
     # Temperature data (uses Fahrenheit as the percentage values)
-    temperatured = {
-        'min'      : 69,
-        'max'      : 100,
-        'units'    : fahrenheit_unit,
-        'forecast' : None,
-        'value'    : None
-    }
-    temperature = SimpleNamespace(**temperatured)
+    temperature = _Temperature(units=fahrenheit_unit)
 
     # Score data (based on actual vs. maximum net sales)
-    scored = {
-        'value' : 0.00,
-        'total' : 0.00
-    }
-    score = SimpleNamespace(**scored)
+    score = _Score()
 
     # Sanity check the title
     if (title is None) or (len(title.strip()) < 1):
         title = ""
     elif (len(title.strip()) > 30):
-        title = title.strip()[0:30] + "... "
+        title = f"{title.strip()[0:30]}... "
     else:
-        title = title.strip() + " "
+        title = f"{title.strip()} "
 
     # Check for Celsius
     if (celsius):
         temperature.units = celsius_unit
 
+    # Create the display buffer for the text messages
+    # (every line is rewritten each week)
+    buffer = [""] * len(_LINES_LJ)
+
     # Start the main loop
     while (weeks.current <= weeks.total):
 
-        # Create a new display buffer for the text messages
+        # Clear the screen for the new week
         clear()
-        buffer = [None] * len(lines)
- 
+
         # Display the current week number
         buffer[0] = ""
-        buffer[1] = title + "Week #" + str(weeks.current)
+        buffer[1] = f"{title}Week #{weeks.current}"
 
         # Generate a random weather forecast and temperature
-        temperature.forecast = randrange(0, len(forecastd))
+        temperature.forecast = randrange(0, len(_FORECAST_PCT))
         temperature.value = randrange(temperature.min, temperature.max)
         formatted = str(temperature.value)
         if (temperature.units == celsius_unit):
             formatted = str(round(((temperature.value - 32) * (5/9))))
         glyph = ""
         if (not noglyphs):
-            glyph = chr(forecastd[list(forecastd)[temperature.forecast]][1])
+            glyph = chr(_FORECAST_GLYPH[temperature.forecast])
         buffer[2] = ""
-        buffer[3] = "Weather Forecast:  " + \
-                    formatted + temperature.units + " " + \
-                    forecastd[list(forecastd)[temperature.forecast]][2] + \
-                    " " + glyph
+        buffer[3] = f"Weather Forecast:  {formatted}{temperature.units} " \
+                    f"{_FORECAST_NAME[temperature.forecast]} {glyph}"
 
         # Calculate the potential sales as a percentage of the maximum value
         # (lower temperature = fewer sales, severe weather = fewer sales)
-        forecast  = forecastd[list(forecastd)[temperature.forecast]][0]
-        potential = math.floor(weeks.sales * \
-                               (temperature.value / 100) * \
-                               forecast)
-        buffer[4] = "Estimated Sales:   " + str(potential) + " cups"
-
-        # Update the cups cost
-        cups.cost = cups.cost + round(uniform(-1.50, 1.50), 2)
-        if (cups.cost < cups.min):
-            cups.cost = cups.min
-        cups.unit = round(cups.cost / cups.count, 2)
-
-        # Update the lemons cost
-        lemons.cost = lemons.cost + round(uniform(-1.50, 1.50), 2)
-        if (lemons.cost < lemons.min):
-            lemons.cost = lemons.min
-        lemons.unit = round(lemons.cost / lemons.count, 2)
-
-        # Update the sugar cost
-        sugar.cost = sugar.cost + round(uniform(-1.50, 1.50), 2)
-        if (sugar.cost < sugar.min):
-            sugar.cost = sugar.min
-        sugar.unit = round(sugar.cost / sugar.count, 2)
+        # (the value is never negative, so "int" rounds down like "floor")
+        forecast  = _FORECAST_PCT[temperature.forecast]
+        potential = int(weeks.sales * (temperature.value / 100) * forecast)
+        buffer[4] = f"Estimated Sales:   {potential} cups"
+
+        # Update the cups, lemons and sugar costs
+        # (each cost changes randomly, but never drops below its minimum)
+        for stock in (cups, lemons, sugar):
+            stock.cost = max(stock.min, \
+                             stock.cost + round(uniform(-1.50, 1.50), 2))
+            stock.unit = round(stock.cost / stock.count, 2)
 
         # Display the updated item prices
         buffer[5] = ""
         buffer[6] = "Grocery Store Prices"
-        buffer[7] = "  Cups:    " + \
-                    locale.currency(cups.cost, grouping=True) + \
-                    " box of " + str(cups.count)
-        buffer[8] = "  Lemons:  " + \
-                    locale.currency(lemons.cost, grouping=True) + \
-                    " bag of " + str(lemons.count)
-        buffer[9] = "  Sugar:   " + \
-                    locale.currency(sugar.cost, grouping=True) + \
-                    " bag for " + str(sugar.count) + " cups"
+        buffer[7] = f"  Cups:    {_money(cups.cost)} box of {cups.count}"
+        buffer[8] = f"  Lemons:  {_money(lemons.cost)} bag of {lemons.count}"
+        buffer[9] = f"  Sugar:   {_money(sugar.cost)} " \
+                    f"bag for {sugar.count} cups"
 
         # Calculate the unit cost
         unit = cups.unit + lemons.unit + sugar.unit
-        buffer[10] = "           " + \
-                     locale.currency(unit, grouping=True) + \
-                     " cost per serving"
+        buffer[10] = f"           {_money(unit)} cost per serving"
 
         # Display the current inventory
         buffer[11] = ""
         buffer[12] = "My Current Inventory"
-        buffer[13] = "  Cups:    " + str(inventory.cups)
-        buffer[14] = "  Lemons:  " + str(inventory.lemons)
-        buffer[15] = "  Sugar:   " + str(inventory.sugar)
+        buffer[13] = f"  Cups:    {inventory.cups}"
+        buffer[14] = f"  Lemons:  {inventory.lemons}"
+        buffer[15] = f"  Sugar:   {inventory.sugar}"
 
         # Display the current cash
         gainloss   = inventory.cash - inventory.start
         buffer[16] = ""
-        buffer[17] = "My Cash:    " + \
-                     locale.currency(inventory.cash, grouping=True)
-        buffer[18] = "Gain/Loss:  " + \
-                     locale.currency(gainloss, grouping=True)
+        buffer[17] = f"My Cash:    {_money(inventory.cash)}"
+        buffer[18] = f"Gain/Loss:  {_money(gainloss)}"
         buffer[19] = ""
         
         # Output the display buffer
-        # (combines the ASCII art with the text messages)
-        for i in range(len(buffer)):
-            print(lines[i].ljust(width) + "  " + buffer[i])
+        # (fills the frame template with the text messages in a single write)
+        sys.stdout.write(_FRAME.format(*buffer))
 
         # Read the number of cup boxes to purchase
-        newcups = -1
-        while (newcups < 0):
-            try:
-                newcups = int(input("How many boxes of cups to buy? ") or 0)
-                if (newcups > 0):
-                    cost = newcups * cups.cost
-                    if (cost > inventory.cash):
-                        raise Exception("You do not have enough cash.")
-                    inventory.cups += (newcups * cups.count)
-                    inventory.cash -= cost
-                    print("  Purchased " + str(newcups) + \
-                          " box(es) of cups for " + \
-                          locale.currency(cost, grouping=True))
-                    print("  " + \
-                          str(inventory.cups) + " cup inventory, "  + \
-                          locale.currency(inventory.cash, grouping=True) + \
-                          " cash remaining")
-                else:
-                    print("  No additional cups were purchased")
-            except Exception as e:
-                print("  " + str(e))
-                newcups = -1
+        inventory.cups, inventory.cash = \
+            _purchase(cups, inventory.cups, inventory.cash, \
+                      "How many boxes of cups to buy? ", \
+                      "box(es) of cups", "cup", \
+                      "No additional cups were purchased")
 
         # Read the number of lemon bags to purchase
-        newlemons = -1
-        while (newlemons < 0):
-            try:
-                newlemons = int(input("How many bags of lemons to buy? ") or 0)
-                if (newlemons > 0):
-                    cost = newlemons * lemons.cost
-                    if (cost > inventory.cash):
-                        raise Exception("You do not have enough cash.")
-                    inventory.lemons += (newlemons * lemons.count)
-                    inventory.cash   -= cost
-                    print("  Purchased " + str(newlemons) + \
-                          " bag(s) of lemons for " + \
-                          locale.currency(cost, grouping=True))
-                    print("  " + \
-                          str(inventory.lemons) + " lemon inventory, "  + \
-                          locale.currency(inventory.cash, grouping=True) + \
-                          " cash remaining")
-                else:
-                    print("  No additional lemons were purchased")
-            except Exception as e:
-                print("  " + str(e))
-                newlemons = -1
+        inventory.lemons, inventory.cash = \
+            _purchase(lemons, inventory.lemons, inventory.cash, \
+                      "How many bags of lemons to buy? ", \
+                      "bag(s) of lemons", "lemon", \
+                      "No additional lemons were purchased")
 
         # Read the number of sugar bags to purchase
-        newsugar = -1
-        while (newsugar < 0):
-            try:
-                newsugar = int(input("How many bags of sugar to buy? ") or 0)
-                if (newsugar > 0):
-                    cost = newsugar * sugar.cost
-                    if (cost > inventory.cash):
-                        raise Exception("You do not have enough cash.")
-                    inventory.sugar += (newsugar * sugar.count)
-                    inventory.cash  -= cost
-                    print("  Purchased " + str(newsugar) + \
-                          " bag(s) of sugar for " + \
-                          locale.currency(cost, grouping=True))
-                    print("  " + \
-                          str(inventory.sugar) + " sugar inventory, "  + \
-                          locale.currency(inventory.cash, grouping=True) + \
-                          " cash remaining")
-                else:
-                    print("  No additional sugar was purchased")
-            except Exception as e:
-                print("  " + str(e))
-                newsugar = -1
+        inventory.sugar, inventory.cash = \
+            _purchase(sugar, inventory.sugar, inventory.cash, \
+                      "How many bags of sugar to buy? ", \
+                      "bag(s) of sugar", "sugar", \
+                      "No additional sugar was purchased")
 
         # Read the actual price
         price = 0.00
         while (price <= 0.00):
             try:
                 raw   = input("How much should the lemonade cost? ")
-                price = float(re.sub("[^0-9.-]", "", raw) or 0.00)
+                raw   = "".join(c for c in raw if c in _PRICE_CHARS)
+                price = float(raw or 0.00)
                 if (price <= 0.00):
                     raise Exception("The price must be greater than zero.")
             except Exception as e:
-                print("  " + str(e))
+                print(f"  {e}")
                 price = 0.00
-        print("  Setting the price at " + \
-              locale.currency(price, grouping=True))
+        print(f"  Setting the price at {_money(price)}")
 
         # Calculate the weekly sales based on price and lowest inventory level
         # (higher markup price = fewer sales, limited by the inventory on-hand)
@@ -467,15 +629,27 @@ def start_lemonade(title="Lemonade Stand", celsius=False, \
         net    = sales * margin
         
         # Add a new row to the summary
-        weeks.summary.append({ 'sales' : sales, 'price' : price })
+        # (each row is only formatted once, as the earlier rows never change)
+        weeks.summary_lines.append(f"  Week {weeks.current:>{pad_week}}:  "
+                                   f"{sales:>{pad_sale}} sold x "
+                                   f"{_money(price)} ea.")
+        weeks.sold = weeks.sold + sales
 
         # Simulate a sense of time passing (each dot represents a sale)
+        # (each sale is scheduled against a single clock, so the time spent
+        # printing the dots is not added on top of the waits)
         if (not nowait):
+            import time # time functions, only used here
             print("\nNow Serving:")
-            for i in range(sales):
-                print(". ", end="", flush=True)
-                time.sleep(randrange(250, 1500) / 1000) # convert milliseconds
-            print()
+            write    = sys.stdout.write
+            flush    = sys.stdout.flush
+            deadline = time.monotonic()
+            for _ in range(sales):
+                write(". ")
+                flush() # show each dot as the sale is made
+                deadline += randrange(250, 1500) / 1000 # convert milliseconds
+                time.sleep(max(0, deadline - time.monotonic()))
+            write("\n")
                 
         # Update the inventory levels to reflect consumption
         inventory.cups   = inventory.cups   - sales
@@ -485,79 +659,39 @@ def start_lemonade(title="Lemonade Stand", celsius=False, \
         gainloss         = inventory.cash   - inventory.start
   
         # Display the calculated sales information
+        # (along with the updated inventory levels, in a single write)
         clear()
-        print("\nSales Results Week #" + \
-              str(weeks.current) + " of " + str(weeks.total))
-        print("  Unit Cost (per serving):  " + \
-              locale.currency(unit, grouping=True))
-        print("  Actual Price:             " + \
-              locale.currency(price, grouping=True))
-        print("  Profit Margin:            " + \
-              locale.currency(margin, grouping=True))
-        print("  Actual Sales:             " + \
-              str(sales) + " x " + locale.currency(price, grouping=True))
-        print("  Gross Profit:             " + \
-              locale.currency(gross, grouping=True))
-        print("  Net Profit:               " + \
-              locale.currency(net, grouping=True))
-        print("  Current Cash:             " + \
-              locale.currency(inventory.cash, grouping=True))
-        print("  Total Gain/Loss:          " + \
-              locale.currency(gainloss, grouping=True))
-        
-        # Display the updated inventory levels
-        print("\nRemaining Inventory")
-        print("  Cups:                     " + str(inventory.cups))
-        print("  Lemons:                   " + str(inventory.lemons))
-        print("  Sugar:                    " + str(inventory.sugar))
+        sys.stdout.write(
+            f"\nSales Results Week #{weeks.current} of {weeks.total}\n"
+            f"  Unit Cost (per serving):  {_money(unit)}\n"
+            f"  Actual Price:             {_money(price)}\n"
+            f"  Profit Margin:            {_money(margin)}\n"
+            f"  Actual Sales:             {sales} x {_money(price)}\n"
+            f"  Gross Profit:             {_money(gross)}\n"
+            f"  Net Profit:               {_money(net)}\n"
+            f"  Current Cash:             {_money(inventory.cash)}\n"
+            f"  Total Gain/Loss:          {_money(gainloss)}\n"
+            f"\nRemaining Inventory\n"
+            f"  Cups:                     {inventory.cups}\n"
+            f"  Lemons:                   {inventory.lemons}\n"
+            f"  Sugar:                    {inventory.sugar}\n")
   
         # Display the weekly sales summary
-        pad_week = len(str(weeks.total))
-        pad_sale = len(str(weeks.sales))
-        total    = 0
-        print("\nWeekly Sales Summary")
-        for i in range(len(weeks.summary)):
-            print("  Week " + str(i + 1).rjust(pad_week) + ":  " + \
-                  str(weeks.summary[i]['sales']).rjust(pad_sale) + \
-                  " sold x " + \
-                  locale.currency(weeks.summary[i]['price'], grouping=True) + \
-                  " ea.")
-            total = total + weeks.summary[i]['sales']
-
-        # Loop through a range of prices to find the highest net profit
-        maxsales = 0
-        maxprice = 0.00
-        maxgross = 0.00
-        maxnet   = 0.00
-        minnet   = net
-        for i in range(25, 2500, 25):
-            price  = i / 100 # range uses integers, not currency (floats)
-            sales  = get_sales_amount(potential, unit, price)
-            margin = price - unit
-            gross  = sales * price
-            net    = sales * margin
-            if (sales  >  0) and \
-                (sales <= potential) and \
-                (unit  <= price):
-                    if (net > maxnet):
-                        maxsales = sales
-                        maxprice = price
-                        maxgross = gross
-                        maxnet   = net
+        summary = "\n".join(weeks.summary_lines)
+        sys.stdout.write(f"\nWeekly Sales Summary\n{summary}\n")
+
+        # Find the price that would have returned the highest net profit
+        minnet = net
+        maxsales, maxprice, maxgross, maxnet = get_best_price(potential, unit)
         if (maxnet > minnet):
             print("\nYour sales could have been:")
-            print("  " + str(maxsales) + " sold x " + \
-                  locale.currency(maxprice, grouping=True) + \
-                  " ea. = " + \
-                  locale.currency(maxgross, grouping=True) + \
-                  " for a net profit of " + \
-                  locale.currency(maxnet, grouping=True))
-            if (inventory.cups <= 0):
-                print("  You ran out of cups.")
-            if (inventory.lemons <= 0):
-                print("  You ran out of lemons.")
-            if (inventory.sugar <= 0):
-                print("  You ran out of sugar.")
+            print(f"  {maxsales} sold x {_money(maxprice)} ea. = "
+                  f"{_money(maxgross)} for a net profit of {_money(maxnet)}")
+            for item, level in (("cups",   inventory.cups), \
+                                ("lemons", inventory.lemons), \
+                                ("sugar",  inventory.sugar)):
+                if (level <= 0):
+                    print(f"  You ran out of {item}.")
         else:
             print("\nCongratulations -- your sales were perfect!")
 
@@ -568,13 +702,10 @@ def start_lemonade(title="Lemonade Stand", celsius=False, \
         # Increment the week number
         if (weeks.current == weeks.total):
             success = round((score.value / score.total) * 100)
-            print("\nYou've made " + \
-                  locale.currency(score.value, grouping=True) + \
-                  " out of a possible " + \
-                  locale.currency(score.total, grouping=True) + \
-                  " for a score of " + str(success) + "%")
-            print("You've sold " + str(total) + \
-                  " total cups -- see you again next time!")
+            print(f"\nYou've made {_money(score.value)} out of a possible "
+                  f"{_money(score.total)} for a score of {success}%")
+            print(f"You've sold {weeks.sold} total cups -- "
+                  f"see you again next time!")
         weeks.current = weeks.current + 1
         input("\nPress ENTER to Continue")
 